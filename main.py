@@ -18,12 +18,13 @@ the entire day (when the market is open, or as per requirement).
 
 import os       # miscellaneous os interfaces
 import sys      # configuring python runtime environment
-import json     # module to manipulate json object in python
+import gzip     # compressed daily log of the json responses
 import time     # library for time manipulation, and logging
 import shutil   # module for high level file operations like copy
 import warnings # surface a notice when ssl verification is bypassed
 
 import argparse # argument parser for additional controls
+import collections # deque of the pending background json dumps
 
 # use `datetime` to control and preceive the environment
 # in addition `pandas` also provides date time functionalities
@@ -31,6 +32,7 @@ import datetime as dt
 
 from tqdm import tqdm as TQ # progress bar for loops
 from uuid import uuid4 as UUID # unique identifier for objs
+from concurrent.futures import ThreadPoolExecutor # background io
 
 import pandas as pd
 
@@ -38,7 +40,9 @@ pd.set_option('display.max_rows', 50) # max. rows to show
 pd.set_option('display.max_columns', 15) # max. cols to show
 pd.options.display.float_format = '{:,.3f}'.format # float precisions
 
+import orjson # https://github.com/ijl/orjson, json dump as bytes
 import xlwings as xw # https://www.xlwings.org/
+import openpyxl # https://openpyxl.readthedocs.io/, headless xlsx writer
 
 # ! please download the prettify file from gist/github
 # https://gist.github.com/ZenithClown/c6b4c51de4d4dac564ecbe0e178955cb
@@ -60,35 +64,70 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 import nseoptions # https://github.com/iTraders/nseoptions
 
-def writejson(response : dict, symbol : str, timestamp : dt.datetime | str, outdir : str) -> bool:
-    timestamp = str(timestamp).replace(":", "") # time is now formatted
-    filename = os.path.join(outdir, f"{symbol} #{str(UUID())[:7].upper()} at {timestamp}.json")
+# ..versionchanged:: 2026-10-15 Responses Appended to a Session Log File
+def writejson(response : dict, filestem : str, outdir : str) -> bool:
+    # ? one json line per response in a single compressed file for the session,
+    # each write appends a gzip member and the members read as one stream
+    filename = os.path.join(outdir, f"{filestem}.jsonl.gz")
 
-    with open(filename, "w") as f:
-        json.dump(response, f, indent = 2, sort_keys = False, default = str)
+    with gzip.open(filename, "ab", compresslevel = 6) as f:
+        f.write(orjson.dumps(response, default = str) + b"\n")
 
     return True
 
 
-def writefile(file : str, opchain : pd.DataFrame, model : object) -> bool:
-    wb = xw.Book(file) # open the copied template file
+# ..versionchanged:: 2026-10-15 Fewer COM Round-Trips per Refresh
+def writefile(sht : xw.Sheet, opchain : pd.DataFrame, model : object) -> bool:
+    # populate the option chain from A12, a plain list of lists is marshalled
+    # as a single array while the dataframe converter walks through each cell
+    sht["A12"].value = opchain.values.tolist()
 
-    # populate the sheets with sheet selection, and defining output cell, like:
-    wb.sheets["Option Chain"]["A12"].options(header = False, index = False).value = opchain
+    # write other important metric/information value from the objects, the
+    # put-call-ratio is in the same column and is written in the same call
+    sht["O1"].options(transpose = True).value = [
+        model.underlying, model.timestamp, model.put_call_ratio
+    ]
 
-    # write other important metric/information value from the objects
-    wb.sheets["Option Chain"]["O1"].options(transpose = True).value = [model.underlying, model.timestamp]
+    # ! totals are not contiguous, cells in between (B1, AB1) are formulas
+    sht["A1"].value = model.tot_oi_ce
+    sht["AC1"].value = model.tot_oi_pe
 
-    # attributes related to the calculation or put-call-ratio
-    wb.sheets["Option Chain"]["O3"].value = model.put_call_ratio
+    sht["D1"].value = model.tot_vol_ce
+    sht["Z1"].value = model.tot_vol_pe
 
-    wb.sheets["Option Chain"]["A1"].value = model.tot_oi_ce
-    wb.sheets["Option Chain"]["AC1"].value = model.tot_oi_pe
+    return True # ! do not save the file here, saved once on exit
 
-    wb.sheets["Option Chain"]["D1"].value = model.tot_vol_ce
-    wb.sheets["Option Chain"]["Z1"].value = model.tot_vol_pe
 
-    return True # ! do not save the file, com error is raised
+# ..versionadded:: 2026-10-15 Headless Writer using `openpyxl` Engine
+# ? (row, column) of the metric cells in the `Option Chain` sheet
+METRICCELLS = dict(
+    underlying = (1, 15), timestamp = (2, 15), put_call_ratio = (3, 15),
+    tot_oi_ce = (1, 1), tot_oi_pe = (1, 29), tot_vol_ce = (1, 4), tot_vol_pe = (1, 26)
+)
+
+# ? workbook and sheet handles, template is parsed once per session file
+WORKBOOKS = dict()
+
+def writexlsx(file : str, opchain : pd.DataFrame, model : object) -> bool:
+    # ! openpyxl drops the sparklines and conditional formatting extensions
+    # of the template, and the file must not be open in excel while saving
+    if file not in WORKBOOKS:
+        wb = openpyxl.load_workbook(file)
+        WORKBOOKS[file] = (wb, wb["Option Chain"])
+
+    wb, ws = WORKBOOKS[file]
+
+    for attribute, (row, column) in METRICCELLS.items():
+        value = getattr(model, attribute) # nan is written as a blank cell
+        ws.cell(row = row, column = column, value = None if pd.isna(value) else value)
+
+    # populate the option chain from A12, rows are streamed as plain tuples
+    for row, values in enumerate(opchain.itertuples(index = False, name = None), start = 12):
+        for column, value in enumerate(values, start = 1):
+            ws.cell(row = row, column = column, value = None if pd.isna(value) else value)
+
+    wb.save(file)
+    return True
 
 
 if __name__ == "__main__":
@@ -102,6 +141,14 @@ if __name__ == "__main__":
         help = "Bypass SSL certificate verification (a warning is shown)."
     )
 
+    # ..versionadded:: 2026-10-15 Choice of the MS Excel Writer Engine
+    parser.add_argument(
+        "--engine",
+        choices = ["xlwings", "openpyxl"],
+        default = "xlwings",
+        help = "Writer for the output file, `openpyxl` does not require MS Excel."
+    )
+
     # ? get arguments from the argparse controller - use in forward
     args = parser.parse_args()
 
@@ -164,9 +211,30 @@ if __name__ == "__main__":
     responsedir = os.path.join(".", "output", str(today))
     os.makedirs(responsedir, exist_ok = True)
 
+    # ! the json log is named for the session, like the output file, so two
+    # sessions on the same symbol never append to the same compressed file
+    jsonstem = f"{symbol} for {expiry} #{fileid}"
+
     print(f"{time.ctime()} : Staring API Collection")
     print(f"  >> Output File Path: {filename}", end = "\n\n")
 
+    # ..versionchanged:: 2026-10-15 Workbook Opened Once for the Session
+    # ! reconnecting to excel through com is costly, the book and the sheet
+    # handles are created once and reused for every refresh of the data
+    book = xw.Book(filename) if args.engine == "xlwings" else None
+    sheet = book.sheets["Option Chain"] if book is not None else None
+
+    # ..versionadded:: 2026-10-15 JSON Response is Dumped in the Background
+    # ? the dump overlaps with the next fetch, while the pending dumps are
+    # bounded so that a slow disk does not hold many responses in memory
+    # ! a single worker, the dumps are appended to the same file in order
+    executor = ThreadPoolExecutor(max_workers = 1)
+    pending, maxpending = collections.deque(), 2
+
+    # ..versionadded:: 2026-10-15 Unchanged Snapshot is Not Dumped Again
+    # ? nse stamps every snapshot, an unchanged timestamp is the same data
+    lastdumped = None
+
     # ..versionchanged:: 2026-06-12 Graceful Exit on Interrupt and Capped Retries
     try:
         while True:
@@ -180,16 +248,55 @@ if __name__ == "__main__":
             )
 
             opchain = model.makeclean(verbose = True)
-
-            writefile(file = filename, opchain = opchain, model = model)
-            writejson(
-                response, symbol, timestamp = model.timestamp, outdir = responsedir
+            print(
+                f"  >> Fetch Time         : {API.elapsed['network']:,.0f} ms "
+                f"(+ {API.elapsed['decode']:,.0f} ms to decode)"
             )
 
-            _ = [time.sleep(1) for _ in TQ(range(30), desc = "Waiting to Refresh...")]
+            if book is None:
+                writexlsx(file = filename, opchain = opchain, model = model)
+            else:
+                try:
+                    writefile(sht = sheet, opchain = opchain, model = model)
+                except Exception as err:
+                    # ! stale handle, e.g. the workbook is closed in excel - reacquire
+                    # the book (reopened if required) and the sheet, then write again
+                    print(f"  >> Reopening the Workbook : {err}")
+                    book = xw.Book(filename)
+                    sheet = book.sheets["Option Chain"]
+                    writefile(sht = sheet, opchain = opchain, model = model)
+
+            # ! `.result()` re-raises any error of a finished background dump
+            while pending and (pending[0].done() or len(pending) >= maxpending):
+                pending.popleft().result()
+
+            if model.timestamp != lastdumped:
+                pending.append(executor.submit(
+                    writejson, response, jsonstem, outdir = responsedir
+                ))
+
+                lastdumped = model.timestamp
+
+            # ..versionchanged:: 2026-10-15 Countdown is Updated every 5 Seconds
+            with TQ(total = 30, desc = "Waiting to Refresh...") as countdown:
+                for _ in range(6):
+                    time.sleep(5)
+                    countdown.update(5)
     except KeyboardInterrupt:
         print(f"\n{time.ctime()} : Stopped by User (CTRL + C), Exiting Gracefully.")
         sys.exit(0)
     except ConnectionError as err:
         print(f"{time.ctime()} : {err} - Exiting.")
         sys.exit(1)
+    finally:
+        executor.shutdown(wait = True) # ? let the pending json dumps complete
+        API.close() # ? release the connections of the persistent session
+
+        # ? persist the latest data once, when the session is terminated
+        # ! com error is raised if excel is closed or busy, report and move on
+        if book is not None:
+            for action in (book.save, book.close):
+                try:
+                    action()
+                except Exception as err:
+                    print(f"{time.ctime()} : Workbook `{action.__name__}()` Failed - {err}")
@@ -13,19 +13,42 @@ a traded symbol (index/stock) from the NSE India public API.
     API which mandates an expiry date per request. Valid expiries are
     discovered via :meth:`NSEOptionChain.expiries` and set using
     :meth:`NSEOptionChain.setexpiry` before fetching the chain.
+
+:NOTE: The polling loop is network bound - the HTTPS round-trip to the
+    NSE India website takes hundreds of milliseconds while decoding and
+    processing the payload takes a few. The time of each stage of the
+    last fetch is recorded in :attr:`NSEOptionChain.elapsed`, so check
+    the measured numbers before micro-optimizing the in-process code.
 """
 
+import os
+import copy
 import time
 import datetime as dt
 
 import yaml
 import requests
 
-from tqdm import tqdm as TQ
+from concurrent.futures import ThreadPoolExecutor
+
+# ..versionchanged:: 2026-10-15 Fallback to Standard Library JSON Decoder
+try:
+    from orjson import loads as jsonloads
+except ImportError:
+    # ? orjson is optional, the standard library decoder also accepts bytes
+    from json import loads as jsonloads
 
 from nseoptions import CONFIG
 from nseoptions.processing import normalizeexpiry
 
+# ..versionadded:: 2026-10-15 Parsed Configuration Cached per File Version
+# ? libyaml (c) bindings when available, else the pure python safe loader
+YAMLLOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# ? parsed configuration keyed on (path, modification time) of the file,
+# so an edited file is parsed again while repeated calls are not parsed
+_CONFIGCACHE = dict()
+
 
 class NSEOptionChain:
     """
@@ -81,6 +104,15 @@ class NSEOptionChain:
           may hang indefinitely on blocked requests. Defaults to 15.
     """
 
+    # ..versionadded:: 2026-10-15 Fixed Attribute Layout using `__slots__`
+    # ! attributes set lazily by `setconfig()`/`setexpiry()` are declared
+    # here as well, an unset slot is still reported false by `hasattr()`
+    __slots__ = (
+        "symbol", "expiry", "verify", "timeout", "session", "elapsed",
+        "URI_HEADER", "NSE_WARMUP_URI", "NSE_CONTRACT_URI", "NSE_API_URI",
+        "_apiuri"
+    )
+
     # ..versionchanged:: 2026-06-12 Migrate to NSE v3 Option Chain API
     def __init__(
         self, symbol : str, expiry : str | dt.date | None = None, **kwargs
@@ -97,8 +129,12 @@ class NSEOptionChain:
         # ? session is created lazily by `__newsession__()` on first fetch
         self.session = None
 
+        # ? time (milliseconds) of each stage of the last successful fetch
+        self.elapsed = dict()
+
 
     # ..versionchanged:: 2026-06-12 Warmed Session, Timeout and Capped Retries
+    # ..versionchanged:: 2026-10-15 Exponential Backoff Capped at `waittime`
     def response(self, waittime : int = 10, maxretries : int = 30) -> dict:
         """
         Fetch the Option Chain JSON Payload from the NSE v3 API
@@ -107,15 +143,20 @@ class NSEOptionChain:
         symbol and expiry from the NSE India website using a warmed-up
         persistent session (see :meth:`__newsession__`). On any failure
         the session is discarded (to force a fresh cookie warm-up) and
-        the request is retried after a countdown of ``waittime``
-        seconds, for a maximum of ``maxretries`` attempts. With the
-        defaults of :mod:`main` (``waittime = 20``) the retry budget
-        tolerates roughly a 10 minute NSE outage before giving up.
+        the request is retried after an exponential backoff (1, 2, 4,
+        ... seconds) capped at ``waittime`` seconds, for a maximum of
+        ``maxretries`` attempts. A transient failure is thus retried
+        almost immediately, while a longer outage is polled only once
+        every ``waittime`` seconds. With the defaults of :mod:`main`
+        (``waittime = 20``) the retry budget tolerates roughly a 9
+        minute NSE outage before giving up. The time (in milliseconds)
+        of the request (``network``) and of the JSON decoding
+        (``decode``) of the last successful fetch is recorded in the
+        :attr:`elapsed` attribute of the object.
 
         :type  waittime: int
-        :param waittime: Number of seconds to sleep (with a visual
-            ``tqdm`` countdown) between two consecutive retries when
-            the fetch fails. Defaults to 10.
+        :param waittime: Maximum number of seconds to sleep between two
+            consecutive retries when the fetch fails. Defaults to 10.
 
         :type  maxretries: int
         :param maxretries: Maximum number of fetch attempts before the
@@ -141,24 +182,34 @@ class NSEOptionChain:
                     self.__newsession__()
 
                 # ? verify/timeout are passed per request, not on the session
+                # ? while headers are already set once on the session object
+                started = time.perf_counter()
                 session_response = self.session.get(
                     self.NSE_API_URI,
-                    headers = self.URI_HEADER,
                     timeout = self.timeout,
                     verify = self.verify
                 )
                 session_response.raise_for_status()
-                response = session_response.json()
+
+                # ? large payload, parsed from the raw bytes (orjson if installed)
+                fetched = time.perf_counter()
+                response = jsonloads(session_response.content)
 
                 # ? sanity check the payload before returning to caller
                 if "records" not in response or "filtered" not in response:
                     raise ValueError("malformed v3 response, missing records/filtered")
 
+                # ..versionadded:: 2026-10-15 Measured Time of the Fetch Stages
+                self.elapsed = dict(
+                    network = (fetched - started) * 1e3,
+                    decode = (time.perf_counter() - fetched) * 1e3
+                )
+
                 return response
             except KeyboardInterrupt:
                 raise # ? allow a clean ctrl+c exit mid-fetch, no retry
             except Exception as e:
-                self.session = None # ! forces cookie re-warm on next attempt
+                self.close() # ! forces cookie re-warm on next attempt
                 print(f"{time.ctime()} : Failed to Fetch Data - {e}")
 
                 # ! on the last attempt, chain the cause and skip the wait
@@ -167,15 +218,18 @@ class NSEOptionChain:
                         f"NSE v3 fetch failed after {maxretries} attempts"
                     ) from e
 
-                _ = [
-                    time.sleep(1)
-                    for _ in TQ(range(waittime), desc = f"#{count} Retrying...")
-                ]
+                # ? backoff doubles on every failure, capped at `waittime`
+                # ..versionchanged:: 2026-10-15 Single Sleep, No Countdown Bar
+                backoff = min(2 ** (count - 1), waittime)
+                print(f"  >> #{count} Retrying in {backoff} Seconds...")
+
+                time.sleep(backoff)
 
         raise ConnectionError(f"NSE v3 fetch failed after {maxretries} attempts")
 
 
     # ..versionchanged:: 2026-06-12 Migrate to NSE v3 Option Chain API
+    # ..versionchanged:: 2026-10-15 Parsed Configuration Cached per File
     def setconfig(self, file : str = CONFIG, type : str = "index", **kwargs) -> dict:
         """
         Configuration Data for the NSE Option Chain Module
@@ -183,7 +237,9 @@ class NSEOptionChain:
         The default configuration is stored under the `config` folder
         at the base of the module. However, the user can set and update
         any part of the configuration by passing the file path or
-        passing the individual values.
+        passing the individual values. The parsed file is cached on its
+        path and modification time, hence repeated calls do not parse
+        the same file again while an edited file is always re-read.
 
         The chain endpoint is the NSE v3 template which carries both a
         ``{symbol}`` and an ``{expiry}`` placeholder - the template is
@@ -226,8 +282,13 @@ class NSEOptionChain:
         apiuri = kwargs.get("apiuri", None)
 
         # todo: check if file exists, and file is not None
-        with open(file, "r") as f:
-            config = yaml.safe_load(f)
+        key = (os.path.abspath(file), os.stat(file).st_mtime_ns)
+        if key not in _CONFIGCACHE:
+            with open(file, "r") as f:
+                _CONFIGCACHE[key] = yaml.load(f, Loader = YAMLLOADER)
+
+        # ! the configuration is updated below, never modify the cached dict
+        config = copy.deepcopy(_CONFIGCACHE[key])
 
         # ? update any part of the configuration if passed by enduser
         config["config"]["header"] = header if header else config["config"]["header"]
@@ -341,7 +402,34 @@ class NSEOptionChain:
 
                 # ! discard the stale/blocked session so the next iteration
                 # re-warms it inside the try, retrying a warm-up failure too
-                self.session = None
+                self.close()
+
+
+    # ..versionadded:: 2026-10-15 Explicit Release of the Session
+    def close(self) -> None:
+        """
+        Close the Session and Release the Pooled Connections
+
+        The warmed-up session (see :meth:`__newsession__`) is kept open
+        across the calls so that every poll reuses the keep-alive
+        connection and the cookies. The method closes the session and
+        releases the connections, which is also done when the object
+        is used as a context manager (``with NSEOptionChain(...)``).
+        A new session is created lazily on the next fetch.
+        """
+
+        if self.session is not None:
+            self.session.close()
+
+        self.session = None
+
+
+    def __enter__(self) -> "NSEOptionChain":
+        return self
+
+
+    def __exit__(self, *args) -> None:
+        self.close()
 
 
     def __newsession__(self) -> None:
@@ -367,3 +455,45 @@ class NSEOptionChain:
         )
 
         self.session = session
+
+
+# ..versionadded:: 2026-10-15 Concurrent Fetch for Multiple Symbols
+def fetchmany(chains : list, maxworkers : int = 4, **kwargs) -> list[dict]:
+    """
+    Fetch the Option Chain Payloads of Multiple Symbols Concurrently
+
+    The option chain of each symbol is an independent request to the
+    same NSE India host, hence polling multiple symbols (for example
+    ``NIFTY``, ``BANKNIFTY``, etc.) one after the other adds up the
+    latency of all the requests. The function calls
+    :meth:`NSEOptionChain.response` of each object in a bounded pool of
+    threads, such that the total time is close to the slowest request.
+    Each object keeps its own warmed-up session (and cookies), which
+    is reused across the calls.
+
+    :type  chains: list
+    :param chains: List of :class:`NSEOptionChain` objects, with the
+        expiry already set using :meth:`NSEOptionChain.setexpiry`.
+
+    :type  maxworkers: int
+    :param maxworkers: Maximum number of concurrent requests to the
+        NSE India website, the value is kept low as too many parallel
+        requests are blocked by the website. Defaults to 4.
+
+    Keyword Arguments
+    -----------------
+
+    The keyword arguments (``waittime``, ``maxretries``) are passed as
+    is to :meth:`NSEOptionChain.response` of each of the object.
+
+    :raises Exception: The first error (in the order of the ``chains``)
+        raised by :meth:`NSEOptionChain.response`, like a
+        :class:`ConnectionError` once the retries are exhausted.
+
+    :rtype:  list
+    :return: List of the raw v3 option chain payloads, in the same
+        order as the ``chains``.
+    """
+
+    with ThreadPoolExecutor(max_workers = maxworkers) as executor:
+        return list(executor.map(lambda chain : chain.response(**kwargs), chains))
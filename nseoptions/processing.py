@@ -18,10 +18,48 @@ features of the package.
     expiry strings are now canonicalized via :func:`normalizeexpiry`.
 """
 
+import sys
 import datetime as dt
 
+import numpy as np
 import pandas as pd
 
+# ? fields of each (CE/PE) leg that are returned for the option chain
+# ! the order is load-bearing for the excel template (29 columns, A..AC)
+# ..versionchanged:: 2026-06-12 NSE v3 Field Names for Bid/Ask Depth
+COLUMNS = (
+    "openInterest",
+    "changeinOpenInterest",
+    "pchangeinOpenInterest",
+    "totalTradedVolume",
+    "impliedVolatility",
+    "lastPrice",
+    "change",
+    "pChange",
+    "totalBuyQuantity",
+    "totalSellQuantity",
+    "buyQuantity1",
+    "buyPrice1",
+    "sellQuantity1",
+    "sellPrice1"
+)
+
+# ..versionadded:: 2026-10-15 Output Column Order Computed Once at Import
+# ? call columns, strike price and then the put columns in reversed order
+OUTPUTCOLUMNS = (
+    *[f"{col}_ce" for col in COLUMNS],
+    "strikePrice",
+    *[f"{col}_pe" for col in COLUMNS[::-1]]
+)
+
+# ..versionadded:: 2026-10-15 Direct Conversions for the Return Types
+# ? `np.ndarray` is not a converter, hence the frame method is mapped, while
+# any other type (like `dict`, `list`) is called with the frame as before
+RTYPES = {
+    pd.DataFrame : lambda frame : frame,
+    np.ndarray : lambda frame : frame.to_numpy()
+}
+
 
 def normalizeexpiry(expiry : str | dt.date) -> str:
     """
@@ -113,6 +151,13 @@ class OptionChainProcessing:
           below the ATM to be fetched from the data. Default is 20.
     """
 
+    # ..versionadded:: 2026-10-15 Fixed Attribute Layout using `__slots__`
+    # ! attributes set by `makeclean()` are declared here as well
+    __slots__ = (
+        "symbol", "apikey", "response", "expiry", "nstrikes", "multiple",
+        "timestamp", "underlying", "atm", "lstrike", "hstrike", "ce", "pe"
+    )
+
     def __init__(
         self,
         symbol : str,
@@ -186,6 +231,35 @@ class OptionChainProcessing:
         return values.get(symbol, 50)
 
 
+    # ..versionchanged:: 2026-10-15 Lazy Put-Call Ratio & Aggregated Totals
+    # ? read from the `filtered` block only when accessed, and not by `makeclean()`
+    @property
+    def tot_oi_ce(self) -> int:
+        return self.response["filtered"]["CE"]["totOI"]
+
+
+    @property
+    def tot_oi_pe(self) -> int:
+        return self.response["filtered"]["PE"]["totOI"]
+
+
+    @property
+    def tot_vol_ce(self) -> int:
+        return self.response["filtered"]["CE"]["totVol"]
+
+
+    @property
+    def tot_vol_pe(self) -> int:
+        return self.response["filtered"]["PE"]["totVol"]
+
+
+    @property
+    def put_call_ratio(self) -> float:
+        # ! guard: CE total OI is zero pre-open, NaN renders as a blank excel cell
+        tot_oi_ce = self.tot_oi_ce
+        return self.tot_oi_pe / tot_oi_ce if tot_oi_ce else float("nan")
+
+
     def makeclean(self, rtype : callable = pd.DataFrame, verbose : bool = False) -> object:
         """
         Core Functionality to Clean and Process the Data
@@ -196,7 +270,9 @@ class OptionChainProcessing:
 
         :type  rtype: callable
         :param rtype: A callable object that can be used to return the
-            data. The default is :class:`pandas.DataFrame`.
+            data. The default is :class:`pandas.DataFrame`. The type
+            :class:`numpy.ndarray` returns a 2D array of the data frame,
+            while any other callable is called with the data frame.
 
         :type  verbose: bool
         :param verbose: Print the debug and/or other relevant information
@@ -209,108 +285,77 @@ class OptionChainProcessing:
 
         data = self.response["records"]["data"]
 
-        # ? get put-call-ratio and total aggregated traded volume
-        self.tot_oi_ce = self.response["filtered"]["CE"]["totOI"]
-        self.tot_oi_pe = self.response["filtered"]["PE"]["totOI"]
-
-        # ! guard: CE total OI is zero pre-open, NaN renders as a blank excel cell
-        self.put_call_ratio = (
-            self.tot_oi_pe / self.tot_oi_ce if self.tot_oi_ce else float("nan")
-        )
-
-        self.tot_vol_ce = self.response["filtered"]["CE"]["totVol"]
-        self.tot_vol_pe = self.response["filtered"]["PE"]["totVol"]
-
         # ? v3 item-level key is `expiryDates` (plural) while the CE/PE legs
         # ? still carry `expiryDate` (singular) which is what this loop
         # ? consumes - do not "fix"
-        ocdata = []
-        for item in data:
-            for instrument, info in item.items():
-                if instrument in ["CE", "PE"]:
-                    dump = info # current line item dump
-                    dump["instrumentType"] = instrument # CE/PE Key
-                    ocdata.append(dump)
-                else:
-                    pass
-
-        if verbose:
-            print(f"{dt.datetime.now()} : Data Fetched for `{self.symbol}`")
-            print(f"  >> Underlying Value   : ₹ {self.underlying:,.2f}")
-            print(f"  >> Response Timestamp : {self.timestamp}")
-            print(f"  >> ATM Strike Price   : ₹ {self.atm:,.2f}")
-            print(f"  >> Strike Price Range : ₹ {self.lstrike:,.2f} - ₹ {self.hstrike:,.2f}")
-
-        frame = pd.DataFrame(ocdata) # keep only ce/pe data then filter
-
-        # ! v3 leg-level `expiryDate` carries a numeric month (`16-06-2026`)
-        # while the canonical form is `16-Jun-2026` - compare parsed dates so
-        # the filter is format agnostic (live-probed on 2026-06-12)
-        # ..versionchanged:: 2026-06-12 Date Based Expiry Filter for NSE v3
-        expirydates = pd.to_datetime(frame["expiryDate"], dayfirst = True).dt.date
+        # ..versionchanged:: 2026-10-15 Records are Filtered before the Frame
         expiry = dt.datetime.strptime(self.expiry, "%d-%b-%Y").date()
+        expirymatch = dict() # ? leg expiry string to match, parsed only once
 
-        frame = frame[
-            (expirydates == expiry)
-            & (frame["strikePrice"].between(self.lstrike, self.hstrike))
-        ]
+        legs = dict(CE = [], PE = [])
+        for item in data:
+            for instrument, records in legs.items():
+                info = item.get(instrument) # ! not tagged, response is kept as is
+                if info is None or not (self.lstrike <= info["strikePrice"] <= self.hstrike):
+                    continue
+
+                # ! v3 leg-level `expiryDate` carries a numeric month (`16-06-2026`)
+                # while the canonical form is `16-Jun-2026` - compare parsed dates so
+                # the filter is format agnostic (live-probed on 2026-06-12)
+                # ..versionchanged:: 2026-06-12 Date Based Expiry Filter for NSE v3
+                if info["expiryDate"] not in expirymatch:
+                    expirymatch[info["expiryDate"]] = pd.to_datetime(
+                        info["expiryDate"], dayfirst = True
+                    ).date() == expiry
+
+                if expirymatch[info["expiryDate"]]:
+                    records.append(info)
+
+        # ? frames are built only from the records of the expiry and strikes
+        # since we already know the expiry and symbol, only the strike price
+        # and the fields of the option chain are selected from the records
+        # ..versionchanged:: 2026-10-15 Columns Selected while Building Frame
+        legs = {
+            instrument : pd.DataFrame.from_records(records, columns = ["strikePrice", *COLUMNS])
+            for instrument, records in legs.items()
+        }
+
+        # ..versionchanged:: 2026-10-15 Verbose Block is a Single Write
+        if verbose:
+            sys.stdout.write(
+                f"{dt.datetime.now()} : Data Fetched for `{self.symbol}`\n"
+                f"  >> Underlying Value   : ₹ {self.underlying:,.2f}\n"
+                f"  >> Response Timestamp : {self.timestamp}\n"
+                f"  >> ATM Strike Price   : ₹ {self.atm:,.2f}\n"
+                f"  >> Strike Price Range : ₹ {self.lstrike:,.2f} - ₹ {self.hstrike:,.2f}\n"
+            )
 
         # ! a wrong expiry must never silently produce an empty output
-        if frame.empty:
+        if legs["CE"].empty and legs["PE"].empty:
             available = self.response["records"].get("expiryDates", [])
             raise ValueError(
                 f"No option chain data for expiry `{self.expiry}`, "
                 f"available expiry dates are {available}."
             )
 
-        # since we already know the expiry and symbol, we can delete them
-        # also identifier is not required as we will not be placing order
-        dropcols = [
-            "expiryDate",
-            "underlying",
-            "identifier",
-            "underlyingValue"
-        ]
-
-        frame.drop(columns = dropcols, inplace = True, errors = "ignore")
+        # the call and put data are seperated while parsing, set as attribute
+        self.ce, self.pe = legs["CE"], legs["PE"]
 
-        # now we can seperate the call and put data, set as attribute
-        self.ce = frame[frame["instrumentType"] == "CE"].copy()
-        self.pe = frame[frame["instrumentType"] == "PE"].copy()
-
-        # ? alternative: `how = "outer"` + `sort_values("strikePrice")` would
-        # ? retain one-sided strikes; kept inner deliberately to preserve the
+        # ? alternative: `np.union1d` of the strikes would retain the
+        # ? one-sided strikes; kept inner deliberately to preserve the
         # ? current behavior
-        opchain = pd.merge(
-            self.ce, self.pe, how = "inner", on = "strikePrice",
-            suffixes = ("_ce", "_pe")
+        # ..versionchanged:: 2026-10-15 Wide Frame Built from Aligned Strikes
+        strikes, cepos, pepos = np.intersect1d(
+            self.ce["strikePrice"].to_numpy(), self.pe["strikePrice"].to_numpy(),
+            assume_unique = True, return_indices = True
         )
 
-        dropcols = ["instrumentType_ce", "instrumentType_pe"]
-        opchain.drop(columns = dropcols, inplace = True, errors = "ignore")
-
         # mimic and return the columns as in the nse option chain
-        # ! the order is load-bearing for the excel template (29 columns, A..AC)
-        # ..versionchanged:: 2026-06-12 NSE v3 Field Names for Bid/Ask Depth
-        columns = [
-            "openInterest",
-            "changeinOpenInterest",
-            "pchangeinOpenInterest",
-            "totalTradedVolume",
-            "impliedVolatility",
-            "lastPrice",
-            "change",
-            "pChange",
-            "totalBuyQuantity",
-            "totalSellQuantity",
-            "buyQuantity1",
-            "buyPrice1",
-            "sellQuantity1",
-            "sellPrice1"
+        values = [
+            *[self.ce[col].to_numpy()[cepos] for col in COLUMNS],
+            strikes,
+            *[self.pe[col].to_numpy()[pepos] for col in COLUMNS[::-1]]
         ]
 
-        cecols_ = [f"{col}_ce" for col in columns]
-        pecols_ = [f"{col}_pe" for col in columns][::-1]
-
-        opchain = opchain[cecols_ + ["strikePrice"] + pecols_]
-        return opchain if rtype == pd.DataFrame else rtype(opchain)
+        opchain = pd.DataFrame(dict(zip(OUTPUTCOLUMNS, values)))
+        return RTYPES.get(rtype, rtype)(opchain)